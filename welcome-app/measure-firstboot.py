@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Compare the unified first-boot shell with the old two-app first login.
+
+Before: the GTK Solvy onboarding and the Qt Welcome app (run by
+solvionyx-firstboot.sh). Both are autostarted on first login and run side by
+side, so their peak RSS is summed, "first" is the earliest window to become
+interactive and "ready" the latest.
+
+After: the shell is driven from its Welcome page to the keys page, left there
+for --keys-pause seconds (a user typing, which is when Solvy warms up), then
+through Finish. The run only counts if Finish shows an in-process Solvy
+window. "first" is the Welcome page, "ready" the Solvy window and "hand-off"
+the time from clicking Finish until Solvy is shown.
+
+Neither old app opened Solvy, so the shell's peak includes a Solvy window the
+old pair never had. A cold Solvy start is reported on its own row for
+reference: its "hand-off" is spawn-to-interactive, what "Open Solvy" cost.
+
+Each app runs in its own interpreter exactly as on first login, with a hook on
+its main loop that reports on the first idle iteration after a window is
+shown. Peak RSS comes from wait4. Medians over --runs are reported.
+
+The onboarding is no longer in the tree; point --onboarding at an installed
+copy or at one extracted from git:
+
+  git show <rev>:solviony-ai/solvy/onboarding/solvy-onboarding.py > /tmp/onboarding.py
+
+Run inside a graphical session, under xvfb-run, or with QT_QPA_PLATFORM=offscreen
+(Qt apps only; pass --no-onboarding since GTK has no offscreen backend).
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+import threading
+
+BASE = os.path.dirname(os.path.abspath(__file__))
+
+FIRST = "SOLVIONYX-FIRST"
+FINISH = "SOLVIONYX-FINISH"
+READY = "SOLVIONYX-READY"
+FAILED = "SOLVIONYX-FAILED"
+
+# Run with -c in a fresh interpreter: argv = [mode[:keys-pause], script, overrides...]
+BOOTSTRAP = r'''
+import os, sys, importlib.util
+mode, _, keys_pause = sys.argv[1].partition(":")
+path = sys.argv[2]
+overrides = dict(a.split("=", 1) for a in sys.argv[3:])
+# As if the script had been started directly
+sys.path.insert(0, os.path.dirname(path))
+
+def report(marker):
+    print(marker, flush=True)
+
+if mode == "gtk":
+    from gi.repository import GLib, Gtk
+    _main = Gtk.main
+    def main():
+        def probe():
+            report("%(first)s")
+            report("%(ready)s")
+            Gtk.main_quit()
+            return False
+        GLib.idle_add(probe)
+        return _main()
+    Gtk.main = main
+else:
+    from PyQt5 import QtCore, QtWidgets
+    _exec = QtWidgets.QApplication.exec_
+    after = QtCore.QTimer.singleShot
+
+    def done():
+        report("%(ready)s")
+        QtWidgets.QApplication.quit()
+
+    def drive():
+        # Walk the shell's pages the way a user clicking Next would
+        shell = next(w for w in QtWidgets.QApplication.topLevelWidgets()
+                     if isinstance(w, module.FirstBootShell))
+
+        def wait_for_hand_off():
+            if shell.isVisible():
+                after(10, wait_for_hand_off)
+            elif shell.solvy_window is not None and shell.solvy_window.isVisible():
+                after(0, done)
+            else:
+                report("%(failed)s")
+                QtWidgets.QApplication.exit(1)
+
+        def click_finish():
+            report("%(finish)s")
+            shell.on_next()
+            wait_for_hand_off()
+
+        def leave_keys_page():
+            shell.on_next()
+            after(0, click_finish)
+
+        shell.on_next()
+        after(int(float(keys_pause or 0) * 1000), leave_keys_page)
+
+    def exec_(*args):
+        def probe():
+            report("%(first)s")
+            drive() if mode == "qt-shell" else done()
+        after(0, probe)
+        return _exec()
+    QtWidgets.QApplication.exec_ = exec_
+
+spec = importlib.util.spec_from_file_location("firstboot_app", path)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+for name, value in overrides.items():
+    setattr(module, name, value)
+sys.argv = [path]
+module.main()
+''' % {"first": FIRST, "finish": FINISH, "ready": READY, "failed": FAILED}
+
+
+def run_once(mode, script, overrides, timeout):
+    cmd = [sys.executable, "-c", BOOTSTRAP, mode, script]
+    cmd += [f"{k}={v}" for k, v in overrides.items()]
+
+    start = time.monotonic()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    killer = threading.Timer(timeout, proc.kill)
+    killer.start()
+
+    times = {}
+    try:
+        for line in proc.stdout:
+            line = line.strip()
+            if line in (FIRST, FINISH, READY, FAILED):
+                times[line] = time.monotonic() - start
+            if line in (READY, FAILED):
+                break
+        proc.stdout.close()
+        _, status, usage = os.wait4(proc.pid, 0)
+    finally:
+        killer.cancel()
+
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    name = os.path.basename(script)
+    if FAILED in times:
+        raise RuntimeError(f"{name} did not hand off to an in-process Solvy window")
+    if READY not in times:
+        raise RuntimeError(
+            f"{name} never became ready (exit {proc.returncode}; killed after {timeout}s if negative)"
+        )
+    # ru_maxrss is in KiB on Linux
+    sample = {"first_s": times[FIRST], "ready_s": times[READY], "rss_mib": usage.ru_maxrss / 1024.0}
+    if FINISH in times:
+        sample["hand_off_s"] = times[READY] - times[FINISH]
+    return sample
+
+
+def measure(mode, script, overrides, runs, timeout, before_each=None):
+    samples = []
+    for _ in range(runs):
+        if before_each:
+            before_each()
+        samples.append(run_once(mode, script, overrides, timeout))
+    return {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+
+
+def concurrent(apps):
+    return {
+        "first_s": min(a["first_s"] for a in apps),
+        "ready_s": max(a["ready_s"] for a in apps),
+        "rss_mib": sum(a["rss_mib"] for a in apps),
+    }
+
+
+def main():
+    installed_solvy = "/usr/share/solvionyx/solvy"
+    tree_solvy = os.path.normpath(os.path.join(BASE, "..", "solviony-ai", "solvy"))
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="samples per app (median is reported)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds before a stuck app is killed")
+    parser.add_argument("--keys-pause", type=float, default=2.0, help="seconds the shell stays on the keys page")
+    parser.add_argument("--shell", default=os.path.join(BASE, "solvionyx-firstboot.py"))
+    parser.add_argument("--welcome", default=os.path.join(BASE, "solvionyx-welcome.py"))
+    parser.add_argument("--onboarding", default="/usr/share/solvy/onboarding/solvy-onboarding.py")
+    parser.add_argument("--no-onboarding", action="store_true", help="leave the GTK onboarding out of 'before'")
+    parser.add_argument(
+        "--solvy-dir", default=installed_solvy if os.path.isdir(installed_solvy) else tree_solvy
+    )
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    solvy = os.path.join(args.solvy_dir, "solvy.py")
+    paths = [args.shell, args.welcome, solvy] + ([] if args.no_onboarding else [args.onboarding])
+    for path in paths:
+        if not os.path.exists(path):
+            parser.error(f"not found: {path}")
+
+    before = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Point every first-boot marker at scratch files so nothing on the host changes
+        scratch = {name: os.path.join(tmp, name) for name in ("firstboot", "first-boot", "autostart")}
+
+        if not args.no_onboarding:
+            open(scratch["first-boot"], "w").close()
+            before["onboarding"] = measure(
+                "gtk", args.onboarding, {"FIRST_BOOT_FLAG": scratch["first-boot"]}, args.runs, args.timeout
+            )
+        before["welcome"] = measure("qt", args.welcome, {}, args.runs, args.timeout)
+        solvy_cold = measure("qt", solvy, {}, args.runs, args.timeout)
+        # Launched cold, Solvy is handed off at spawn
+        solvy_cold["hand_off_s"] = solvy_cold["ready_s"]
+
+        shell_overrides = {
+            "FIRSTBOOT_MARKER": scratch["firstboot"],
+            "ONBOARDING_MARKER": scratch["first-boot"],
+            "ONBOARDING_AUTOSTART": scratch["autostart"],
+            "SOLVY_DIR": args.solvy_dir,
+        }
+        after = measure(
+            f"qt-shell:{args.keys_pause}", args.shell, shell_overrides, args.runs, args.timeout,
+            # The shell clears its marker on close, so recreate it every run
+            before_each=lambda: open(scratch["firstboot"], "w").close(),
+        )
+
+    results = {
+        "before": dict(before, total=concurrent(list(before.values()))),
+        "after": after,
+        "solvy_cold": solvy_cold,
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    def cell(r, key):
+        return f"{r[key]:>11.3f}" if key in r else f"{'-':>11}"
+
+    rows = [(f"  {name}", r) for name, r in before.items()]
+    rows += [("before (pair)", results["before"]["total"]), ("first-boot shell", after)]
+    rows += [("Solvy, cold start", solvy_cold)]
+    print(f"{'':<18}{'peak RSS (MiB)':>16}{'first (s)':>11}{'ready (s)':>11}{'hand-off (s)':>14}")
+    for label, r in rows:
+        print(f"{label:<18}{r['rss_mib']:>16.1f}{cell(r, 'first_s')}{cell(r, 'ready_s')}{cell(r, 'hand_off_s'):>14}")
+    print(f"\nShell 'ready' includes {args.keys_pause:g}s on the keys page.")
+    if args.no_onboarding:
+        print("GTK onboarding not measured; 'before' is the Welcome app alone.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
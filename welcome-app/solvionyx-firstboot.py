@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Solvionyx first-boot shell.
+
+Replaces the GTK Solvy onboarding and the Qt Welcome app on first login with
+one Qt process: shared state is read once, pages are built on first visit and
+the session ends by handing over to an in-process Solvy window.
+"""
+import os
+import sys
+import threading
+import importlib.util
+from PyQt5 import QtCore, QtWidgets, uic
+
+import welcome_common as common
+
+BASE = os.path.dirname(os.path.abspath(__file__))
+SOLVY_DIR = "/usr/share/solvionyx/solvy"
+
+FIRSTBOOT_MARKER = "/var/lib/solvionyx/firstboot"
+
+# Left behind by the old GTK onboarding; cleared here so it never starts again
+ONBOARDING_MARKER = "/var/lib/solvionyx/first-boot"
+ONBOARDING_AUTOSTART = "/etc/xdg/autostart/solvy-onboarding.desktop"
+
+KEY_DIR = "/etc/solvionyx/ai/keys"
+KEYS = (
+    # (id, label, file, env var exported by solvy-env.sh)
+    ("openai", "OpenAI", os.path.join(KEY_DIR, "openai.key"), "OPENAI_API_KEY"),
+    ("gemini", "Gemini", os.path.join(KEY_DIR, "gemini.key"), "GEMINI_API_KEY"),
+)
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _keys_writable():
+    # KEY_DIR may not exist yet; check the nearest directory that does
+    path = KEY_DIR
+    while not os.path.exists(path):
+        path = os.path.dirname(path)
+    return os.access(path, os.W_OK)
+
+
+def _import_solvy():
+    path = os.path.join(SOLVY_DIR, "solvy.py")
+    if not os.path.exists(path):
+        return None
+    try:
+        spec = importlib.util.spec_from_file_location("solvy_app", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    except Exception:
+        return None
+
+
+class FirstBootState:
+    """Everything the pages read, loaded once before the window is built."""
+
+    def __init__(self):
+        self.caps = common.load_capabilities()
+        self.os_release = common.read_kv_file("/etc/os-release")
+        # Only presence is checked; key contents are never read back
+        self.key_status = {key_id: os.path.exists(path) for key_id, _, path, _ in KEYS}
+        self.keys_writable = _keys_writable()
+
+    @property
+    def pretty_name(self):
+        return self.os_release.get("PRETTY_NAME") or "Solvionyx OS — Aurora"
+
+
+class FirstBootShell(QtWidgets.QMainWindow):
+    WELCOME_PAGE, SOLVY_PAGE, FINISH_PAGE = range(3)
+
+    # Emitted from the import thread; delivered queued on the GUI thread
+    solvyImported = QtCore.pyqtSignal(object)
+
+    def __init__(self, state):
+        super().__init__()
+        self.state = state
+        self.setWindowTitle(f"Welcome to {state.pretty_name}")
+        self.resize(780, 560)
+
+        qss_path = os.path.join(BASE, "ui/style.qss")
+        if os.path.exists(qss_path):
+            with open(qss_path, "r", encoding="utf-8") as f:
+                self.setStyleSheet(f.read())
+
+        # Page factories; each page is built the first time it is shown
+        self.page_factories = [self._build_welcome_page, self._build_solvy_page, self._build_finish_page]
+        self.pages = {}
+        self.index = self.WELCOME_PAGE
+
+        self.key_entries = {}
+        self.solvy_thread = None
+        self.solvy_window = None
+        self.solvy_ready = False
+        self.finish_pending = False
+        self.solvyImported.connect(self._build_solvy)
+
+        central = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(central)
+        self.stack = QtWidgets.QStackedWidget()
+        layout.addWidget(self.stack, 1)
+
+        nav = QtWidgets.QHBoxLayout()
+        self.backButton = QtWidgets.QPushButton("Back")
+        self.backButton.clicked.connect(lambda: self.show_page(self.index - 1))
+        self.skipButton = QtWidgets.QPushButton("Skip")
+        self.skipButton.clicked.connect(lambda: self.show_page(self.index + 1))
+        self.nextButton = QtWidgets.QPushButton("Next")
+        self.nextButton.clicked.connect(self.on_next)
+        nav.addWidget(self.backButton)
+        nav.addStretch(1)
+        nav.addWidget(self.skipButton)
+        nav.addWidget(self.nextButton)
+        layout.addLayout(nav)
+
+        self.setCentralWidget(central)
+        self.show_page(self.WELCOME_PAGE)
+
+    # ------------------------------------------------------------------
+    # Navigation
+    # ------------------------------------------------------------------
+    def show_page(self, index):
+        index = max(self.WELCOME_PAGE, min(index, self.FINISH_PAGE))
+        page = self.pages.get(index)
+        if page is None:
+            page = self.page_factories[index]()
+            self.pages[index] = page
+            self.stack.addWidget(page)
+
+        self.index = index
+        self.stack.setCurrentWidget(page)
+        self.backButton.setEnabled(index > self.WELCOME_PAGE)
+        self.skipButton.setVisible(index == self.SOLVY_PAGE)
+        self.nextButton.setText("Finish" if index == self.FINISH_PAGE else "Next")
+
+    def on_next(self):
+        if self.index == self.FINISH_PAGE:
+            self.finish()
+            return
+        if self.index == self.SOLVY_PAGE and not self.save_keys():
+            return
+        self.show_page(self.index + 1)
+
+    def closeEvent(self, event):
+        # Closing the window in any way ends first boot, as the old Welcome
+        # did; solvionyx-firstboot.sh still removes the marker after a crash
+        for path in (FIRSTBOOT_MARKER, ONBOARDING_MARKER, ONBOARDING_AUTOSTART):
+            _remove_quietly(path)
+        super().closeEvent(event)
+
+    # ------------------------------------------------------------------
+    # Pages
+    # ------------------------------------------------------------------
+    def _page(self, title, subtitle):
+        page = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(page)
+
+        titleLabel = QtWidgets.QLabel(title)
+        titleLabel.setAlignment(QtCore.Qt.AlignCenter)
+        layout.addWidget(titleLabel)
+
+        subtitleLabel = QtWidgets.QLabel(subtitle)
+        subtitleLabel.setAlignment(QtCore.Qt.AlignCenter)
+        subtitleLabel.setWordWrap(True)
+        layout.addWidget(subtitleLabel)
+        return page, layout
+
+    def _build_welcome_page(self):
+        # Same layout as the Welcome app; the .ui root is a QMainWindow, so it
+        # is loaded into one and embedded as a plain child widget
+        page = QtWidgets.QMainWindow()
+        uic.loadUi(os.path.join(BASE, "ui/welcome_window.ui"), page)
+        page.setWindowFlags(QtCore.Qt.Widget)
+
+        page.titleLabel.setText(f"Welcome to {self.state.pretty_name}")
+        # Solvy opens at the end of this flow instead
+        page.openSolvyButton.hide()
+
+        caps = self.state.caps
+        page.connectWifiButton.clicked.connect(lambda: common.open_wifi(caps))
+        page.systemUpdateButton.clicked.connect(lambda: common.check_updates(caps))
+        page.storeButton.clicked.connect(common.open_store)
+        page.supportButton.clicked.connect(common.open_support)
+        return page
+
+    def _build_solvy_page(self):
+        page, layout = self._page(
+            "Configure Solvy AI Providers",
+            "Enter your API keys below. They are stored locally on your system "
+            "and are never uploaded or shared. You may skip this step.",
+        )
+
+        form = QtWidgets.QFormLayout()
+        for key_id, label, _, _ in KEYS:
+            entry = QtWidgets.QLineEdit()
+            entry.setEchoMode(QtWidgets.QLineEdit.Password)
+            entry.setEnabled(self.state.keys_writable)
+            if self.state.key_status.get(key_id):
+                entry.setPlaceholderText("Already configured — leave empty to keep")
+            else:
+                entry.setPlaceholderText(f"{label} API Key")
+            self.key_entries[key_id] = entry
+            form.addRow(label, entry)
+        layout.addLayout(form)
+
+        if not self.state.keys_writable:
+            note = QtWidgets.QLabel(
+                f"This account cannot save keys to {KEY_DIR}. "
+                "Skip for now and ask an administrator to add them."
+            )
+            note.setWordWrap(True)
+            layout.addWidget(note)
+        layout.addStretch(1)
+
+        QtCore.QTimer.singleShot(0, self.warm_solvy)
+        return page
+
+    def _build_finish_page(self):
+        page, layout = self._page(
+            "You're all set",
+            "Solvy will open when you finish. You can change these settings later "
+            "from the Solvionyx Control Center.",
+        )
+
+        btn = QtWidgets.QPushButton("Open Settings")
+        btn.clicked.connect(lambda: common.open_settings(self.state.caps))
+        layout.addWidget(btn, 0, QtCore.Qt.AlignCenter)
+        layout.addStretch(1)
+        return page
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+    def write_key(self, path, value):
+        value = value.strip()
+        if not value:
+            return False
+        os.makedirs(KEY_DIR, exist_ok=True)
+        # Created 0600 so the key is never readable by others, even briefly
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            # An existing file keeps its old mode through O_CREAT
+            os.fchmod(fd, 0o600)
+            f.write(value)
+        return True
+
+    def save_keys(self):
+        for key_id, label, path, env in KEYS:
+            value = self.key_entries[key_id].text()
+            try:
+                written = self.write_key(path, value)
+            except OSError as e:
+                QtWidgets.QMessageBox.warning(
+                    self, "Solvy", f"Could not save the {label} key: {e}\n\nUse Skip to continue without it."
+                )
+                return False
+            if written:
+                self.state.key_status[key_id] = True
+                # Same variables solvy-env.sh exports, for the in-process hand-off
+                os.environ[env] = value.strip()
+                self.key_entries[key_id].clear()
+        return True
+
+    # ------------------------------------------------------------------
+    # Solvy hand-off
+    # ------------------------------------------------------------------
+    def warm_solvy(self):
+        """
+        Import solvy.py off the GUI thread, then build SolvyApp hidden on the
+        GUI thread while the user is still on the keys page.
+        """
+        if self.solvy_thread is not None:
+            return
+        # solvy.py imports its voice engines relative to its own directory.
+        # Added here, before the thread starts, and left in place so imports
+        # on the GUI thread never race with a changing sys.path.
+        if SOLVY_DIR not in sys.path:
+            sys.path.append(SOLVY_DIR)
+        self.solvy_thread = threading.Thread(
+            target=lambda: self.solvyImported.emit(_import_solvy()), daemon=True
+        )
+        self.solvy_thread.start()
+
+    def _build_solvy(self, module):
+        if module is not None:
+            try:
+                self.solvy_window = module.SolvyApp()
+            except Exception:
+                self.solvy_window = None
+        self.solvy_ready = True
+        if self.finish_pending:
+            QtWidgets.QApplication.restoreOverrideCursor()
+            self._hand_off()
+
+    def finish(self):
+        if self.finish_pending:
+            return
+        if not self.solvy_ready:
+            # Warm-up still running; hand off as soon as Solvy is built
+            self.finish_pending = True
+            self.backButton.setEnabled(False)
+            self.nextButton.setEnabled(False)
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+            self.warm_solvy()
+            return
+        self._hand_off()
+
+    def _hand_off(self):
+        if self.solvy_window is not None:
+            self.solvy_window.show()
+        else:
+            common.try_popen(common.caps_cmd(self.state.caps, "SOLVY_CMD", "solvy"), silent=True)
+        self.close()
+
+
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    force = "--force" in argv[1:]
+    if not force and not os.path.exists(FIRSTBOOT_MARKER):
+        return 0
+
+    # Read shared state before Qt starts so no page has to load it again
+    state = FirstBootState()
+
+    app = QtWidgets.QApplication(argv)
+    win = FirstBootShell(state)
+    win.show()
+    return app.exec_()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -22,12 +22,18 @@ if echo "$DESKTOP_LC" | grep -q "gnome"; then
   fi
 fi
 
-# Launch Solvionyx Welcome (Qt app)
+# Unified first-boot shell (Welcome + Solvy setup in one Qt process), or the
+# Qt Welcome app if the shell is not installed. The shell clears the marker
+# itself when its window closes because it then keeps running as Solvy.
+SHELL_APP="/usr/share/solvionyx/welcome-app/solvionyx-firstboot.py"
 WELCOME="/usr/share/solvionyx/welcome-app/solvionyx-welcome.py"
-if [ -x "$WELCOME" ]; then
+if [ -x "$SHELL_APP" ]; then
+  "$SHELL_APP" || true
+elif [ -x "$WELCOME" ]; then
   "$WELCOME" || true
 fi
 
-# Mark first boot complete (single authority for the marker)
+# Mark first boot complete however the app exited, including a crash before
+# the shell cleared the marker itself
 rm -f "$MARKER" || true
 exit 0
@@ -1,53 +1,11 @@
 #!/usr/bin/env python3
 import os
 import sys
-import subprocess
 from PyQt5 import QtWidgets, uic
 
-BASE = os.path.dirname(os.path.abspath(__file__))
-
-
-def _try_popen(cmd, silent=False):
-    try:
-        if silent:
-            return subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return subprocess.Popen(cmd)
-    except Exception:
-        return None
-
-
-def _read_kv_file(path):
-    data = {}
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                k, v = line.split("=", 1)
-                data[k.strip()] = v.strip()
-    except Exception:
-        pass
-    return data
-
+import welcome_common as common
 
-def _detect_desktop():
-    return (os.environ.get("XDG_CURRENT_DESKTOP", "") or "").lower()
-
-
-def _load_capabilities():
-    base_dir = "/usr/lib/solvionyx/desktop-capabilities.d"
-    caps = {}
-    caps.update(_read_kv_file(os.path.join(base_dir, "default.conf")))
-
-    d = _detect_desktop()
-    if "gnome" in d:
-        caps.update(_read_kv_file(os.path.join(base_dir, "gnome.conf")))
-    elif "kde" in d or "plasma" in d:
-        caps.update(_read_kv_file(os.path.join(base_dir, "kde.conf")))
-    elif "xfce" in d:
-        caps.update(_read_kv_file(os.path.join(base_dir, "xfce.conf")))
-    return caps
+BASE = os.path.dirname(os.path.abspath(__file__))
 
 
 class WelcomeApp(QtWidgets.QMainWindow):
@@ -61,7 +19,7 @@ class WelcomeApp(QtWidgets.QMainWindow):
             with open(qss_path, "r", encoding="utf-8") as f:
                 self.setStyleSheet(f.read())
 
-        self.caps = _load_capabilities()
+        self.caps = common.load_capabilities()
 
         # Phase 3 copy polish (only if widgets exist)
         if hasattr(self, "titleLabel"):
@@ -108,43 +66,25 @@ class WelcomeApp(QtWidgets.QMainWindow):
 
     def open_settings_and_exit(self):
         # Desktop-aware settings opener
-        settings_cmd = (self.caps.get("SETTINGS_UI") or "").strip()
-        if settings_cmd:
-            if _try_popen(settings_cmd.split(), silent=True) is not None:
-                self.close()
-                return
-
-        # GNOME fallback
-        if _try_popen(["gnome-control-center"], silent=True) is not None:
-            self.close()
-            return
-
+        common.open_settings(self.caps)
         self.close()
 
     def open_solvy(self):
-        cmd = (self.caps.get("SOLVY_CMD", "solvy") or "solvy").split()
-        if _try_popen(cmd, silent=True) is None:
+        cmd = common.caps_cmd(self.caps, "SOLVY_CMD", "solvy")
+        if common.try_popen(cmd, silent=True) is None:
             QtWidgets.QMessageBox.information(self, "Solvy", "Solvy is not installed yet.")
 
     def open_wifi(self):
-        wifi_cmd = (self.caps.get("NETWORK_UI") or "").strip()
-        if wifi_cmd and _try_popen(wifi_cmd.split()) is not None:
-            return
-        if _try_popen(["nm-connection-editor"]) is not None:
-            return
-        _try_popen(["gnome-control-center", "wifi"]) or _try_popen(["gnome-control-center"])
+        common.open_wifi(self.caps)
 
     def check_updates(self):
-        upd_cmd = (self.caps.get("UPDATES_UI") or "").strip()
-        if upd_cmd and _try_popen(upd_cmd.split(), silent=True) is not None:
-            return
-        _try_popen(["gnome-software"], silent=True)
+        common.check_updates(self.caps)
 
     def open_store(self):
-        _try_popen(["xdg-open", "https://store.solviony.com"], silent=True)
+        common.open_store()
 
     def open_support(self):
-        _try_popen(["xdg-open", "https://solviony.com/support"], silent=True)
+        common.open_support()
 
 
 def main():
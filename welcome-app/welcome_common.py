@@ -0,0 +1,90 @@
+"""
+Helpers shared by the Welcome app and the first-boot shell.
+"""
+import os
+import subprocess
+
+CAPS_DIR = "/usr/lib/solvionyx/desktop-capabilities.d"
+
+STORE_URL = "https://store.solviony.com"
+SUPPORT_URL = "https://solviony.com/support"
+
+
+def try_popen(cmd, silent=False):
+    try:
+        if silent:
+            return subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return subprocess.Popen(cmd)
+    except Exception:
+        return None
+
+
+def read_kv_file(path):
+    data = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                k, v = line.split("=", 1)
+                data[k.strip()] = v.strip().strip('"')
+    except Exception:
+        pass
+    return data
+
+
+def detect_desktop():
+    return (os.environ.get("XDG_CURRENT_DESKTOP", "") or "").lower()
+
+
+def load_capabilities():
+    caps = {}
+    caps.update(read_kv_file(os.path.join(CAPS_DIR, "default.conf")))
+
+    d = detect_desktop()
+    if "gnome" in d:
+        caps.update(read_kv_file(os.path.join(CAPS_DIR, "gnome.conf")))
+    elif "kde" in d or "plasma" in d:
+        caps.update(read_kv_file(os.path.join(CAPS_DIR, "kde.conf")))
+    elif "xfce" in d:
+        caps.update(read_kv_file(os.path.join(CAPS_DIR, "xfce.conf")))
+    return caps
+
+
+def caps_cmd(caps, name, default=""):
+    return (caps.get(name) or default).strip().split()
+
+
+# ----------------------------------------------------------------------
+# Quick actions (desktop-aware, with GNOME fallbacks)
+# ----------------------------------------------------------------------
+def open_wifi(caps):
+    wifi_cmd = caps_cmd(caps, "NETWORK_UI")
+    if wifi_cmd and try_popen(wifi_cmd) is not None:
+        return
+    if try_popen(["nm-connection-editor"]) is not None:
+        return
+    try_popen(["gnome-control-center", "wifi"]) or try_popen(["gnome-control-center"])
+
+
+def check_updates(caps):
+    upd_cmd = caps_cmd(caps, "UPDATES_UI")
+    if upd_cmd and try_popen(upd_cmd, silent=True) is not None:
+        return
+    try_popen(["gnome-software"], silent=True)
+
+
+def open_settings(caps):
+    settings_cmd = caps_cmd(caps, "SETTINGS_UI")
+    if settings_cmd and try_popen(settings_cmd, silent=True) is not None:
+        return
+    try_popen(["gnome-control-center"], silent=True)
+
+
+def open_store():
+    try_popen(["xdg-open", STORE_URL], silent=True)
+
+
+def open_support():
+    try_popen(["xdg-open", SUPPORT_URL], silent=True)